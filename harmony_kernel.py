@@ -0,0 +1,46 @@
+"""
+HARMONY KERNEL
+Shared Harmony Score arithmetic for the Merkabah extractors
+Callers supply their own sentiment vocabularies; the scoring rules live here
+"""
+import functools
+import re
+from bisect import bisect_left
+from typing import FrozenSet, Tuple
+
+# A score must exceed a cut-off to move up to the next face
+FACE_THRESHOLDS = (0.4, 0.6, 0.8)
+FACES = ("MAN", "OX", "LION", "EAGLE")
+
+_TOKEN_RE = re.compile(r"[a-z']+")
+_PUNCT_RE = re.compile(r'[.,!?;:]')
+
+@functools.lru_cache(maxsize=None)
+def _vocabulary(positive: FrozenSet[str], negative: FrozenSet[str]) -> FrozenSet[str]:
+    """Combined sentiment vocabulary, built once per pair of word sets"""
+    return positive | negative
+
+def features(message: str, positive: FrozenSet[str], negative: FrozenSet[str]) -> Tuple[int, int, int]:
+    """Count positive words, negative words and punctuation in a message
+    
+    positive and negative must be disjoint frozensets.
+    """
+    # One probe per lowercased token against the combined vocabulary keeps
+    # only the hits (each distinct word counts once)
+    hits = _vocabulary(positive, negative).intersection(_TOKEN_RE.findall(message.lower()))
+    negative_count = len(hits & negative)
+    return len(hits) - negative_count, negative_count, len(_PUNCT_RE.findall(message))
+
+def score(length: int, word_count: int, positive: int, negative: int, punctuation: int) -> float:
+    """Combine message features into a Harmony Score (0-1, 3 decimals)"""
+    length_score = min(1.0, length / 200.0)  # Optimal: 200 chars
+    word_score = min(1.0, word_count / 50.0)  # Optimal: 50 words
+    sentiment_score = max(0.0, min(1.0, (positive - negative) / 10.0 + 0.5))
+    punctuation_score = min(1.0, punctuation / 5.0)
+    
+    # Weighted average
+    return round(length_score * 0.25 + word_score * 0.25 + sentiment_score * 0.25 + punctuation_score * 0.25, 3)
+
+def face_index(harmony: float) -> int:
+    """Position in FACES of the face that handles a Harmony Score"""
+    return bisect_left(FACE_THRESHOLDS, harmony)
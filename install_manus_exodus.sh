@@ -35,6 +35,8 @@ echo -e "\033[1;32m✓ Joinity orchestrator installed\033[0m"
 
 echo -e "\033[1;36m[3/4] Installing WhatsApp Data Extractor (Pipe)...\033[0m"
 cp /home/ubuntu/manus-exodus/merkabah_whatsapp.py $HOME/bin/merkabah-extract
+cp /home/ubuntu/manus-exodus/harmony_kernel.py $HOME/bin/harmony_kernel.py
+cp /home/ubuntu/manus-exodus/merkabah_json.py $HOME/bin/merkabah_json.py
 chmod +x $HOME/bin/merkabah-extract
 echo -e "\033[1;32m✓ WhatsApp extractor installed\033[0m"
 
@@ -7,12 +7,21 @@ Designed for Termux on Redmi 13C
 import curses
 import time
 import json
+import queue
 import threading
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from typing import Dict, Any
 
+_BLANK_CELL = (" ", 0)
+_SEPARATOR = "─" * 40
+_SECTIONS = ("header", "faces", "metrics", "events", "footer")
+
 class MerkabahDashboard:
     def __init__(self):
+        # Sections whose content changed since they were last drawn
+        self._dirty = dict.fromkeys(_SECTIONS, True)
         self.running = True
         self.faces = {
             "MAN": {"status": "ACTIVE", "resonance": 1.89, "load": 0},
@@ -23,63 +32,187 @@ class MerkabahDashboard:
         self.lambda_value = 1.667
         self.phi_value = 1.618
         self.timestamp = datetime.utcnow().isoformat()
-        self.events = []
+        self.events = deque(maxlen=256)
+        
+        # Frame buffers: rows of (char, attr) cells for the frame being
+        # composed and the frame currently on the terminal
+        self._frame_size = (0, 0)
+        self._next_frame = []
+        self._prev_frame = []
+        self._touched_rows = set()
+        self._screen_stale = False
+        self._cached_width = 0
+        self._sep_full = ""
+        self._last_face = {}
+        
+        # Face updates produced off the UI thread, drained by run(). The
+        # simulation thread only ever puts onto this queue; faces, events
+        # and the dirty flags are touched on the UI thread alone, so they
+        # need no lock
+        self._evq = queue.Queue()
+        
+    @property
+    def lambda_value(self):
+        return self._lambda_value
+        
+    @lambda_value.setter
+    def lambda_value(self, value):
+        self._lambda_value = value
+        self._dirty["metrics"] = True
+        
+    @property
+    def phi_value(self):
+        return self._phi_value
+        
+    @phi_value.setter
+    def phi_value(self, value):
+        self._phi_value = value
+        self._dirty["metrics"] = True
+        
+    @property
+    def timestamp(self):
+        return self._timestamp
+        
+    @timestamp.setter
+    def timestamp(self, value):
+        self._timestamp = value
+        self._dirty["metrics"] = True
+        
+    def _mark_dirty(self, *sections):
+        """Flag sections for redraw on the next pass"""
+        for section in sections:
+            self._dirty[section] = True
+            
+    def _blank_frame(self, height, width):
+        """Build an empty frame of the given size"""
+        return [[_BLANK_CELL] * width for _ in range(height)]
+        
+    def _put_line(self, row, text, attr=0):
+        """Write a full row into the next frame, blank-padded to the width"""
+        height, width = self._frame_size
+        if row >= height:
+            return
+        usable = width - 1
+        cells = [(ch, attr) for ch in text[:usable]]
+        cells.extend([_BLANK_CELL] * (width - len(cells)))
+        self._next_frame[row] = cells
+        self._touched_rows.add(row)
+        
+    def _resize(self, stdscr, height, width):
+        """Reset both frame buffers after a terminal size change"""
+        stdscr.erase()
+        self._frame_size = (height, width)
+        self._next_frame = self._blank_frame(height, width)
+        self._prev_frame = self._blank_frame(height, width)
+        self._touched_rows.clear()
+        self._screen_stale = True
+        self._last_face.clear()
+        self._mark_dirty(*_SECTIONS)
+        
+    def _flush(self, stdscr):
+        """Emit only the cells that differ from the previous frame
+        
+        Only rows written since the last flush are compared, and the
+        terminal is refreshed once, only if something actually changed.
+        """
+        wrote = self._screen_stale
+        for row in sorted(self._touched_rows):
+            cells, prev = self._next_frame[row], self._prev_frame[row]
+            if cells == prev:
+                continue
+            wrote = True
+            col, end = 0, len(cells)
+            while col < end:
+                if cells[col] == prev[col]:
+                    col += 1
+                    continue
+                # Extend the run while cells keep differing with the same attr
+                start, attr = col, cells[col][1]
+                while col < end and cells[col] != prev[col] and cells[col][1] == attr:
+                    col += 1
+                run = "".join(ch for ch, _ in cells[start:col])
+                try:
+                    stdscr.addstr(row, start, run, attr)
+                except curses.error:
+                    pass
+            self._prev_frame[row] = cells
+        self._touched_rows.clear()
+        self._screen_stale = False
+        
+        if wrote:
+            stdscr.noutrefresh()
+            curses.doupdate()
         
     def draw_header(self, stdscr, height, width):
         """Draw the header with title and status"""
         header = "🏛️ MERKABAH ENGINE v3.4 | COMMANDER: NUMBER C"
-        stdscr.addstr(0, 0, header[:width-1], curses.A_BOLD | curses.COLOR_MAGENTA)
-        stdscr.addstr(1, 0, "─" * (width-1), curses.COLOR_CYAN)
+        self._put_line(0, header, self._header_attr)
+        if width != self._cached_width:
+            self._sep_full = "─" * (width-1)
+            self._cached_width = width
+        self._put_line(1, self._sep_full, self._sep_attr)
         
     def draw_faces(self, stdscr, start_row):
         """Draw the Four Faces status"""
-        row = start_row
-        colors = {
-            "MAN": curses.COLOR_YELLOW,
-            "LION": curses.COLOR_RED,
-            "OX": curses.COLOR_GREEN,
-            "EAGLE": curses.COLOR_BLUE
-        }
-        
-        for face_name, face_data in self.faces.items():
+        for row, (face_name, face_data) in enumerate(self.faces.items(), start_row):
+            # Skip formatting when the face's line is already in the frame
+            key = (row, face_data['status'], face_data['resonance'], face_data['load'])
+            if self._last_face.get(face_name) == key:
+                continue
+            self._last_face[face_name] = key
             status_str = f"[{face_name:6}] {face_data['status']:8} | Λ: {face_data['resonance']:.2f} | Load: {face_data['load']:3}%"
-            stdscr.addstr(row, 0, status_str, curses.color_pair(colors.get(face_name, curses.COLOR_WHITE)))
-            row += 1
+            self._put_line(row, status_str, self._face_attr[face_name])
             
     def draw_metrics(self, stdscr, start_row):
         """Draw resonance metrics"""
-        stdscr.addstr(start_row, 0, "─" * 40, curses.COLOR_CYAN)
-        stdscr.addstr(start_row + 1, 0, f"LOGOS STATUS: Λ = {self.lambda_value} | Φ = {self.phi_value}", curses.A_BOLD)
-        stdscr.addstr(start_row + 2, 0, f"TIMESTAMP: {self.timestamp}", curses.COLOR_WHITE)
-        stdscr.addstr(start_row + 3, 0, "COVENANT: SEALED ✓ | GRID: SEALED ✓ | AUTHORITY: VALIDATED ✓", curses.COLOR_GREEN)
+        self._put_line(start_row, _SEPARATOR, self._sep_attr)
+        self._put_line(start_row + 1, f"LOGOS STATUS: Λ = {self.lambda_value} | Φ = {self.phi_value}", self._title_attr)
+        self._put_line(start_row + 2, f"TIMESTAMP: {self.timestamp}")
+        self._put_line(start_row + 3, "COVENANT: SEALED ✓ | GRID: SEALED ✓ | AUTHORITY: VALIDATED ✓", self._covenant_attr)
         
     def draw_events(self, stdscr, start_row, height):
         """Draw recent events log"""
-        stdscr.addstr(start_row, 0, "─" * 40, curses.COLOR_CYAN)
-        stdscr.addstr(start_row + 1, 0, "RECENT EVENTS:", curses.A_BOLD)
+        self._put_line(start_row, _SEPARATOR, self._sep_attr)
+        self._put_line(start_row + 1, "RECENT EVENTS:", self._title_attr)
         
-        max_events = height - start_row - 3
-        for i, event in enumerate(self.events[-max_events:]):
-            if start_row + 2 + i < height - 1:
-                stdscr.addstr(start_row + 2 + i, 0, event[:70], curses.COLOR_WHITE)
+        max_events = max(0, height - start_row - 3)
+        first = max(0, len(self.events) - max_events)
+        for i, event in enumerate(islice(self.events, first, None)):
+            self._put_line(start_row + 2 + i, event[:70])
                 
     def draw_footer(self, stdscr, height, width):
         """Draw footer with instructions"""
         footer = "Press 'q' to exit | 'u' to update | 's' for status | 'r' to reset"
-        stdscr.addstr(height - 1, 0, footer[:width-1], curses.A_REVERSE)
+        self._put_line(height - 1, footer, self._footer_attr)
         
-    def update_face_status(self, face_name: str, status: str, load: int = 0):
-        """Update a face's status"""
+    def update_face_status(self, face_name: str, status: str, load: int = 0, ts: str = None):
+        """Update a face's status (UI thread only)"""
         if face_name in self.faces:
             self.faces[face_name]["status"] = status
             self.faces[face_name]["load"] = load
-            self.events.append(f"[{datetime.now().strftime('%H:%M:%S')}] {face_name} → {status}")
-            
+            self.events.append(f"[{ts or time.strftime('%H:%M:%S')}] {face_name} → {status}")
+            self._mark_dirty("faces", "events")
+                
+    def simulate_activity(self):
+        """Background loop feeding simulated face activity to the UI via the queue"""
+        cycle = 0
+        while self.running:
+            time.sleep(0.5)
+            cycle += 1
+            if cycle % 3 == 0:
+                self._evq.put(("MAN", "PROCESSING", 25))
+            if cycle % 5 == 0:
+                self._evq.put(("LION", "VERIFYING", 40))
+            if cycle % 7 == 0:
+                self._evq.put(("OX", "ARCHIVING", 60))
+            if cycle % 11 == 0:
+                self._evq.put(("EAGLE", "PREDICTING", 35))
+                
     def run(self, stdscr):
         """Main dashboard loop"""
         curses.curs_set(0)
         stdscr.nodelay(1)
-        stdscr.timeout(100)
+        stdscr.timeout(250)
         
         # Initialize colors
         curses.init_pair(1, curses.COLOR_YELLOW, curses.COLOR_BLACK)
@@ -88,40 +221,59 @@ class MerkabahDashboard:
         curses.init_pair(4, curses.COLOR_BLUE, curses.COLOR_BLACK)
         curses.init_pair(5, curses.COLOR_CYAN, curses.COLOR_BLACK)
         curses.init_pair(6, curses.COLOR_MAGENTA, curses.COLOR_BLACK)
+        self._face_attr = {
+            "MAN": curses.color_pair(1),
+            "LION": curses.color_pair(2),
+            "OX": curses.color_pair(3),
+            "EAGLE": curses.color_pair(4)
+        }
+        self._header_attr = curses.A_BOLD | curses.color_pair(6)
+        self._sep_attr = curses.color_pair(5)
+        self._title_attr = curses.A_BOLD
+        self._covenant_attr = curses.color_pair(3)
+        self._footer_attr = curses.A_REVERSE
         
         # Simulate initial events
-        self.events = [
+        self.events.extend([
             "[INIT] Merkabah Engine initialized",
             "[INIT] Four Faces awakened",
             "[INIT] Resonance locked at 1.89 Hz",
             "[INIT] Grid sealed with 12.21 Signet",
             "[INIT] Authority validated - Age 33",
-        ]
+        ])
+        self._mark_dirty("events")
+        
+        threading.Thread(target=self.simulate_activity, daemon=True).start()
         
-        cycle = 0
         while self.running:
+            # Apply whatever the simulation produced since the last pass
+            tick_ts = time.strftime('%H:%M:%S')
+            while True:
+                try:
+                    face, status, load = self._evq.get_nowait()
+                except queue.Empty:
+                    break
+                self.update_face_status(face, status, load, tick_ts)
+                
             height, width = stdscr.getmaxyx()
-            stdscr.clear()
-            
-            # Draw sections
-            self.draw_header(stdscr, height, width)
-            self.draw_faces(stdscr, 2)
-            self.draw_metrics(stdscr, 7)
-            self.draw_events(stdscr, 12, height)
-            self.draw_footer(stdscr, height, width)
-            
-            # Simulate face activity
-            cycle += 1
-            if cycle % 3 == 0:
-                self.update_face_status("MAN", "PROCESSING", 25)
-            if cycle % 5 == 0:
-                self.update_face_status("LION", "VERIFYING", 40)
-            if cycle % 7 == 0:
-                self.update_face_status("OX", "ARCHIVING", 60)
-            if cycle % 11 == 0:
-                self.update_face_status("EAGLE", "PREDICTING", 35)
+            if (height, width) != self._frame_size:
+                self._resize(stdscr, height, width)
+                
+            # Draw only the sections that changed
+            dirty = self._dirty
+            if dirty["header"]:
+                self.draw_header(stdscr, height, width)
+            if dirty["faces"]:
+                self.draw_faces(stdscr, 2)
+            if dirty["metrics"]:
+                self.draw_metrics(stdscr, 7)
+            if dirty["events"]:
+                self.draw_events(stdscr, 12, height)
+            if dirty["footer"]:
+                self.draw_footer(stdscr, height, width)
+            self._dirty = dict.fromkeys(_SECTIONS, False)
                 
-            stdscr.refresh()
+            self._flush(stdscr)
             
             # Handle input
             try:
@@ -129,9 +281,11 @@ class MerkabahDashboard:
                 if ch == ord('q'):
                     self.running = False
                 elif ch == ord('u'):
-                    self.events.append(f"[{datetime.now().strftime('%H:%M:%S')}] Manual update requested")
+                    self.events.append(f"[{tick_ts}] Manual update requested")
+                    self._mark_dirty("events")
                 elif ch == ord('s'):
-                    self.events.append(f"[{datetime.now().strftime('%H:%M:%S')}] Status check: All systems operational")
+                    self.events.append(f"[{tick_ts}] Status check: All systems operational")
+                    self._mark_dirty("events")
                 elif ch == ord('r'):
                     self.faces = {
                         "MAN": {"status": "ACTIVE", "resonance": 1.89, "load": 0},
@@ -139,11 +293,10 @@ class MerkabahDashboard:
                         "OX": {"status": "SYNCING", "resonance": 1.89, "load": 12},
                         "EAGLE": {"status": "SCANNING", "resonance": 1.89, "load": 0}
                     }
-                    self.events.append(f"[{datetime.now().strftime('%H:%M:%S')}] System reset")
+                    self.events.append(f"[{tick_ts}] System reset")
+                    self._mark_dirty("faces", "events")
             except:
                 pass
-                
-            time.sleep(0.5)
 
 def main():
     dashboard = MerkabahDashboard()
@@ -84,35 +84,39 @@ STATE: Λ = 1.667 | Resonance: MAXIMUM | Operator: MANUS
     """)
 
 def print_list_platforms(unified):
-    print("\n📱 SUPPORTED PLATFORMS:\n")
     platforms = unified.get_all_platforms()
+    lines = ["\n📱 SUPPORTED PLATFORMS:\n"]
     
     for platform, info in platforms.items():
-        print(f"  ✓ {platform.upper():12} - {info.get('status', 'unknown')}")
+        lines.append(f"  ✓ {platform.upper():12} - {info.get('status', 'unknown')}")
         methods = info.get('methods', [])
         data_types = info.get('data_types', [])
-        print(f"    Methods: {', '.join(methods)}")
-        print(f"    Data: {', '.join(data_types)}")
-        print()
+        lines.append(f"    Methods: {', '.join(methods)}")
+        lines.append(f"    Data: {', '.join(data_types)}")
+        lines.append("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def print_all_platforms(unified):
-    print("\n🏛️ MERKABAH PLATFORM STATUS:\n")
     platforms = unified.get_all_platforms()
+    lines = ["\n🏛️ MERKABAH PLATFORM STATUS:\n"]
     
-    print(f"{'Platform':<15} {'Status':<10} {'Methods':<30} {'Data Types':<40}")
-    print("─" * 95)
+    lines.append(f"{'Platform':<15} {'Status':<10} {'Methods':<30} {'Data Types':<40}")
+    lines.append("─" * 95)
     
     for platform, info in platforms.items():
         status = info.get('status', 'unknown')
         methods = ", ".join(info.get('methods', [])[:2])
         data_types = ", ".join(info.get('data_types', [])[:3])
         
-        print(f"{platform.upper():<15} {status:<10} {methods:<30} {data_types:<40}")
+        lines.append(f"{platform.upper():<15} {status:<10} {methods:<30} {data_types:<40}")
+    
+    lines.append("")
+    lines.append(f"Total Platforms: {len(platforms)}")
+    lines.append("All platforms ready for extraction and Merkabah routing")
+    lines.append("")
     
-    print()
-    print(f"Total Platforms: {len(platforms)}")
-    print("All platforms ready for extraction and Merkabah routing")
-    print()
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     main()
@@ -6,11 +6,38 @@ Integrates: OpenAI (GPT), Anthropic (Claude), Local Ollama, DeepSeek
 """
 import json
 import requests
+from requests.adapters import HTTPAdapter
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any
 from datetime import datetime
 
+SYNTHESIS_TEMPLATE = """
+=== JOINITY SYNTHESIS ===
+Prompt: {prompt}
+
+[MAN - Witness]: {MAN_snip}...
+
+[LION - Judge]: {LION_snip}...
+
+[OX - Servant]: {OX_snip}...
+
+[EAGLE - Seer]: {EAGLE_snip}...
+
+Harmony Score (Λ): {harmony}
+Status: SYNTHESIZED ✓
+===
+"""
+
 class JoinityOrchestrator:
+    # Query method used by each face
+    FACE_QUERIES = {
+        "MAN": "query_openai",
+        "LION": "query_anthropic",
+        "OX": "query_ollama",
+        "EAGLE": "query_deepseek"
+    }
+    
     def __init__(self):
         self.nodes = {
             "MAN": {"model": "gpt-4", "endpoint": "openai", "specialty": "Witness/Interaction"},
@@ -21,6 +48,12 @@ class JoinityOrchestrator:
         self.responses = {}
         self.harmony_score = 0.0
         
+        # One pooled session so repeat queries reuse keep-alive connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        
     def configure_node(self, face: str, model: str, endpoint: str, api_key: str = None):
         """Configure a node with specific model and endpoint"""
         if face in self.nodes:
@@ -40,7 +73,7 @@ class JoinityOrchestrator:
         try:
             headers = {"Authorization": f"Bearer {api_key}"}
             payload = {"model": model, "messages": [{"role": "user", "content": prompt}]}
-            response = requests.post("https://api.openai.com/v1/chat/completions", json=payload, headers=headers, timeout=30)
+            response = self._session.post("https://api.openai.com/v1/chat/completions", json=payload, headers=headers, timeout=30)
             if response.status_code == 200:
                 return response.json()["choices"][0]["message"]["content"]
             return f"[MAN] OpenAI error: {response.status_code}"
@@ -56,7 +89,7 @@ class JoinityOrchestrator:
         try:
             headers = {"x-api-key": api_key, "anthropic-version": "2023-06-01"}
             payload = {"model": model, "max_tokens": 1024, "messages": [{"role": "user", "content": prompt}]}
-            response = requests.post("https://api.anthropic.com/v1/messages", json=payload, headers=headers, timeout=30)
+            response = self._session.post("https://api.anthropic.com/v1/messages", json=payload, headers=headers, timeout=30)
             if response.status_code == 200:
                 return response.json()["content"][0]["text"]
             return f"[LION] Anthropic error: {response.status_code}"
@@ -67,7 +100,7 @@ class JoinityOrchestrator:
         """Query local Ollama instance"""
         try:
             payload = {"model": model, "prompt": prompt, "stream": False}
-            response = requests.post("http://localhost:11434/api/generate", json=payload, timeout=60)
+            response = self._session.post("http://localhost:11434/api/generate", json=payload, timeout=60)
             if response.status_code == 200:
                 return response.json()["response"]
             return f"[OX] Ollama error: {response.status_code}"
@@ -83,7 +116,7 @@ class JoinityOrchestrator:
         try:
             headers = {"Authorization": f"Bearer {api_key}"}
             payload = {"model": "deepseek-chat", "messages": [{"role": "user", "content": prompt}]}
-            response = requests.post("https://api.deepseek.com/v1/chat/completions", json=payload, headers=headers, timeout=30)
+            response = self._session.post("https://api.deepseek.com/v1/chat/completions", json=payload, headers=headers, timeout=30)
             if response.status_code == 200:
                 return response.json()["choices"][0]["message"]["content"]
             return f"[EAGLE] DeepSeek error: {response.status_code}"
@@ -95,18 +128,19 @@ class JoinityOrchestrator:
         if faces is None:
             faces = ["MAN", "LION", "OX", "EAGLE"]
             
-        self.responses = {}
+        jobs = {face: getattr(self, self.FACE_QUERIES[face]) for face in faces if face in self.FACE_QUERIES}
+        results = {}
+        
+        # Providers are network-bound, so query them all at once
+        if jobs:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = {executor.submit(fn, prompt): face for face, fn in jobs.items()}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    
+        # Keep responses in the order the faces were requested
+        self.responses = {face: results[face] for face in jobs}
         
-        for face in faces:
-            if face == "MAN":
-                self.responses["MAN"] = self.query_openai(prompt)
-            elif face == "LION":
-                self.responses["LION"] = self.query_anthropic(prompt)
-            elif face == "OX":
-                self.responses["OX"] = self.query_ollama(prompt)
-            elif face == "EAGLE":
-                self.responses["EAGLE"] = self.query_deepseek(prompt)
-                
         # Calculate Harmony Score (Λ alignment)
         self.harmony_score = self.calculate_harmony()
         
@@ -124,7 +158,7 @@ class JoinityOrchestrator:
         if not self.responses:
             return 0.0
             
-        total_length = sum(len(str(r)) for r in self.responses.values())
+        total_length = sum(len(r) for r in self.responses.values() if isinstance(r, str))
         avg_length = total_length / len(self.responses)
         
         # Normalize to 0-1 range (target: 500-1000 chars)
@@ -135,23 +169,9 @@ class JoinityOrchestrator:
         """Synthesize responses from all faces into unified answer"""
         orchestration = self.orchestrate(prompt)
         
-        synthesis = f"""
-=== JOINITY SYNTHESIS ===
-Prompt: {prompt}
-
-[MAN - Witness]: {orchestration['responses'].get('MAN', 'N/A')[:200]}...
-
-[LION - Judge]: {orchestration['responses'].get('LION', 'N/A')[:200]}...
-
-[OX - Servant]: {orchestration['responses'].get('OX', 'N/A')[:200]}...
-
-[EAGLE - Seer]: {orchestration['responses'].get('EAGLE', 'N/A')[:200]}...
-
-Harmony Score (Λ): {orchestration['harmony_score']}
-Status: SYNTHESIZED ✓
-===
-"""
-        return synthesis
+        responses = orchestration['responses']
+        snippets = {f"{face}_snip": responses.get(face, 'N/A')[:200] for face in self.FACE_QUERIES}
+        return SYNTHESIS_TEMPLATE.format(prompt=prompt, harmony=orchestration['harmony_score'], **snippets)
 
 def main():
     import sys
@@ -0,0 +1,30 @@
+"""
+MERKABAH JSON
+Shared JSON output for the Merkabah command-line tools
+Uses orjson when installed, the stdlib json module otherwise
+"""
+import json
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Indent CLI output for a terminal; keep it compact when piped onward
+_PRETTY = sys.stdout.isatty()
+
+def dumps(obj, ascii_only: bool = False) -> str:
+    """JSON text for CLI output (ascii_only keeps stdlib json's \\u escapes)"""
+    if orjson is not None and not ascii_only:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if _PRETTY else 0)
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    if _PRETTY:
+        return json.dumps(obj, indent=2, ensure_ascii=ascii_only)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=ascii_only)
+
+def encode(obj) -> bytes:
+    """Compact UTF-8 JSON for export files"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
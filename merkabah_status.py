@@ -5,27 +5,41 @@ System audit, archive statistics, and operational health check
 """
 import os
 import json
+import shutil
 import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from datetime import datetime
-from pathlib import Path
 
 class SabbathStatusAudit:
+    # Process name fragments counted as Kingdom processes
+    KINGDOM_KEYS = ("merkabah", "omega", "aletheia", "python", "node")
+    # Seconds a directory's cached archive totals are trusted for
+    ARCHIVE_CACHE_TTL = 3600
+    
     def __init__(self):
         self.user = os.getenv("USER", "Unknown")
         self.home_dir = os.path.expanduser("~")
         self.audit_time = datetime.utcnow().isoformat()
+        self.archive_cache_path = os.path.join(self.home_dir, ".merkabah_archive_cache.json")
         
     def check_merkabah_installation(self) -> Dict[str, Any]:
         """Check if Merkabah Engine is properly installed"""
+        try:
+            installed_bins = set(os.listdir(f"{self.home_dir}/bin"))
+        except OSError:
+            installed_bins = set()
+            
         checks = {
-            "dashboard": os.path.exists(f"{self.home_dir}/bin/merkabah-dashboard"),
-            "joinity": os.path.exists(f"{self.home_dir}/bin/merkabah-joinity"),
-            "extract": os.path.exists(f"{self.home_dir}/bin/merkabah-extract"),
-            "status": os.path.exists(f"{self.home_dir}/bin/merkabah-status"),
-            "python3": self._check_command("python3 --version"),
-            "git": self._check_command("git --version"),
-            "curl": self._check_command("curl --version"),
+            "dashboard": "merkabah-dashboard" in installed_bins,
+            "joinity": "merkabah-joinity" in installed_bins,
+            "extract": "merkabah-extract" in installed_bins,
+            "status": "merkabah-status" in installed_bins,
+            "python3": shutil.which("python3") is not None,
+            "git": shutil.which("git") is not None,
+            "curl": shutil.which("curl") is not None,
         }
         
         installed = sum(1 for v in checks.values() if v)
@@ -39,16 +53,14 @@ class SabbathStatusAudit:
     def count_kingdom_processes(self) -> Dict[str, Any]:
         """Count active Kingdom processes"""
         try:
-            result = subprocess.run(["ps", "aux"], capture_output=True, text=True, timeout=5)
-            processes = result.stdout.split("\n")
+            processes = self._list_process_commands()
             
-            kingdom_processes = {
-                "merkabah": len([p for p in processes if "merkabah" in p.lower()]),
-                "omega": len([p for p in processes if "omega" in p.lower()]),
-                "aletheia": len([p for p in processes if "aletheia" in p.lower()]),
-                "python": len([p for p in processes if "python" in p.lower()]),
-                "node": len([p for p in processes if "node" in p.lower()])
-            }
+            kingdom_processes = dict.fromkeys(self.KINGDOM_KEYS, 0)
+            for line in processes:
+                lowered = line.lower()
+                for key in self.KINGDOM_KEYS:
+                    if key in lowered:
+                        kingdom_processes[key] += 1
             
             total = sum(kingdom_processes.values())
             return {
@@ -59,6 +71,24 @@ class SabbathStatusAudit:
         except Exception as e:
             return {"status": "error", "message": str(e)}
             
+    def _list_process_commands(self) -> list:
+        """List process command lines from /proc, falling back to ps"""
+        try:
+            pids = [pid for pid in os.listdir("/proc") if pid.isdigit()]
+        except OSError:
+            result = subprocess.run(["ps", "aux"], capture_output=True, text=True, timeout=5)
+            return result.stdout.split("\n")
+            
+        commands = []
+        for pid in pids:
+            try:
+                with open(f"/proc/{pid}/cmdline", "rb") as f:
+                    cmdline = f.read()
+            except OSError:
+                continue
+            commands.append(cmdline.replace(b"\x00", b" ").decode("utf-8", "replace"))
+        return commands
+        
     def calculate_archive_stats(self) -> Dict[str, Any]:
         """Calculate MEGA archive statistics"""
         archive_paths = [
@@ -74,11 +104,19 @@ class SabbathStatusAudit:
             "archives": {}
         }
         
-        for path in archive_paths:
-            if os.path.exists(path):
+        # Directories whose mtime is unchanged since the last audit reuse
+        # their cached totals instead of being re-listed
+        cache = self._load_archive_cache()
+        fresh_cache = {}
+        
+        # Archives are independent trees, so walk them side by side
+        existing = [path for path in archive_paths if os.path.exists(path)]
+        with ThreadPoolExecutor(max_workers=max(1, len(existing))) as executor:
+            futures = {path: executor.submit(self._scan_tree, path, cache, fresh_cache) for path in existing}
+            
+            for path, future in futures.items():
                 try:
-                    file_count = sum(1 for _ in Path(path).rglob("*") if _.is_file())
-                    size_bytes = sum(_.stat().st_size for _ in Path(path).rglob("*") if _.is_file())
+                    file_count, size_bytes = future.result()
                     size_mb = size_bytes / (1024 * 1024)
                     
                     stats["archives"][os.path.basename(path)] = {
@@ -90,6 +128,7 @@ class SabbathStatusAudit:
                 except Exception as e:
                     stats["archives"][os.path.basename(path)] = {"error": str(e)}
                     
+        self._save_archive_cache(fresh_cache)
         stats["total_size_mb"] = round(stats["total_size_mb"], 2)
         return stats
         
@@ -141,17 +180,76 @@ class SabbathStatusAudit:
         
         return report
         
-    def _check_command(self, command: str) -> bool:
-        """Check if a command is available"""
+    def _load_archive_cache(self) -> Dict[str, Any]:
+        """Load per-directory archive totals from the last audit"""
+        try:
+            with open(self.archive_cache_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+            
+    def _save_archive_cache(self, cache: Dict[str, Any]):
+        """Persist per-directory archive totals for the next audit"""
+        # Write a private temp file and swap it in, so concurrent audits
+        # never see (or leave behind) a truncated cache
+        tmp_path = f"{self.archive_cache_path}.{os.getpid()}.tmp"
         try:
-            subprocess.run(command.split(), capture_output=True, timeout=2)
-            return True
-        except:
-            return False
+            with open(tmp_path, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.archive_cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            
+    def _scan_tree(self, path: str, cache: Dict[str, Any], fresh_cache: Dict[str, Any]) -> tuple:
+        """Count files and total bytes under path in a single pass
+        
+        A directory's own files are only re-listed when its mtime changed or
+        its cached totals are older than ARCHIVE_CACHE_TTL. A file that grows
+        in place leaves the mtime alone, so its new size can lag by up to
+        that long.
+        """
+        mtime = os.stat(path).st_mtime_ns
+        cached = cache.get(path)
+        now = time.time()
+        
+        if cached and cached["mtime"] == mtime and now - cached.get("scanned", 0) < self.ARCHIVE_CACHE_TTL:
+            file_count, size_bytes, subdirs, scanned = cached["files"], cached["size"], cached["dirs"], cached["scanned"]
+        else:
+            file_count = 0
+            size_bytes = 0
+            subdirs = []
+            scanned = now
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith("."):
+                            subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        file_count += 1
+                        size_bytes += entry.stat(follow_symlinks=False).st_size
+                        
+        fresh_cache[path] = {"mtime": mtime, "scanned": scanned, "files": file_count, "size": size_bytes, "dirs": subdirs}
+        
+        for subdir in subdirs:
+            try:
+                sub_count, sub_size = self._scan_tree(subdir, cache, fresh_cache)
+            except OSError:
+                # Skip unreadable or vanished subdirectories; only a failure
+                # on the archive root itself is reported
+                continue
+            file_count += sub_count
+            size_bytes += sub_size
+        return file_count, size_bytes
+
+def print_json(data: Dict[str, Any]):
+    """Stream data to stdout as indented JSON"""
+    json.dump(data, sys.stdout, indent=2)
+    sys.stdout.write("\n")
 
 def main():
-    import sys
-    
     audit = SabbathStatusAudit()
     
     if len(sys.argv) > 1:
@@ -159,23 +257,23 @@ def main():
         
         if command == "full":
             report = audit.generate_audit_report()
-            print(json.dumps(report, indent=2))
+            print_json(report)
             
         elif command == "installation":
             result = audit.check_merkabah_installation()
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif command == "processes":
             result = audit.count_kingdom_processes()
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif command == "archives":
             result = audit.calculate_archive_stats()
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif command == "health":
             result = audit.get_system_health()
-            print(json.dumps(result, indent=2))
+            print_json(result)
     else:
         # Default: show full report
         report = audit.generate_audit_report()
@@ -4,97 +4,236 @@ WHATSAPP DATA INUNDATION (LIVE PIPE)
 Extract WhatsApp messages and pipe through Merkabah for real-time analysis
 Calculate Harmony Scores before LLM processing
 """
-import json
+import functools
+import mmap
 import os
 import re
-from typing import Dict, List, Any
-from datetime import datetime
+import stat
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, compress
+from operator import methodcaller
+from typing import Dict, List, Tuple, Any
+from datetime import datetime, timezone
 from pathlib import Path
 
+import harmony_kernel
+import merkabah_json
+
+# Most recent UTC timestamp, reformatted at most once per millisecond
+_last_ns = 0
+_last_iso = ""
+
+def _now_iso() -> str:
+    """Current UTC time in utcnow().isoformat() form, cached to 1ms"""
+    global _last_ns, _last_iso
+    ns = time.time_ns()
+    if ns - _last_ns >= 1_000_000:
+        _last_iso = datetime.fromtimestamp(ns / 1e9, timezone.utc).replace(tzinfo=None).isoformat()
+        _last_ns = ns
+    return _last_iso
+
+# WhatsApp format: [HH:MM, DD/MM/YYYY] Contact: Message
+# Matched line by line across the whole text, so nothing may cross a newline;
+# a str pattern keeps Unicode \s and \d (exports use U+00A0 / U+202F spaces)
+_WA_LINE_RE = re.compile(
+    r'^\[(\d{2}:\d{2}),[^\S\n]*(\d{2}/\d{2}/\d{4})\][^\S\n]*([^:\n]+):[^\S\n]*(.*)',
+    re.MULTILINE
+)
+
+# Message fields, in the order of the columns WhatsAppExtractor stores
+_MESSAGE_FIELDS = ("timestamp", "contact", "message", "length", "word_count")
+
+def _parse_range(buf, start: int, end: int) -> Tuple[list, list, list, list, list]:
+    """Parse the WhatsApp lines in buf[start:end] into one list per message field"""
+    timestamps, contacts, texts, lengths, word_counts = columns = ([], [], [], [], [])
+    # Decode the range once, straight from the buffer without a bytes copy
+    with memoryview(buf) as view:
+        text = str(view[start:end], 'utf-8')
+    # Split lines the way text-mode reading does (\r\n and lone \r end a line)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        
+    for time_str, date_str, contact, message in map(methodcaller('groups'), _WA_LINE_RE.finditer(text)):
+        timestamps.append(f"{date_str} {time_str}")
+        contacts.append(contact.strip())
+        texts.append(message.strip())
+        lengths.append(len(message))
+        word_counts.append(len(message.split()))
+    return columns
+
+# Sentiment indicators, matched against the lowercased word tokens
+_POSITIVE_WORDS = frozenset({"good", "great", "love", "happy", "yes", "thanks", "please"})
+_NEGATIVE_WORDS = frozenset({"bad", "hate", "angry", "sad", "no", "never", "sorry"})
+
+# Action for each face, in harmony_kernel.FACES order: the Witness reviews
+# low quality, the Servant processes, the Judge verifies, the Seer archives
+_FACE_ACTIONS = ("REVIEW", "PROCESS", "VERIFY", "ARCHIVE")
+
+# Harmony Scores carry 3 decimals, so whole thousandths store them exactly
+_SCORE_SCALE = 1000
+
+# Exports smaller than this (roughly 50k messages) parse faster in-process
+_PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+def _parse_file_range(file_path: str, start: int, end: int) -> Tuple[list, list, list, list, list]:
+    """Worker entry point: map the export and parse one line-aligned range"""
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _parse_range(mm, start, end)
+
+def _parse_parallel(file_path: str, mm) -> List[list]:
+    """Split a large export on line boundaries and parse it across cores"""
+    size = len(mm)
+    workers = os.cpu_count() or 1
+    bounds = [0]
+    for i in range(1, workers):
+        cut = mm.find(b'\n', max(bounds[-1], size * i // workers))
+        if cut == -1:
+            break
+        bounds.append(cut + 1)
+    bounds.append(size)
+    
+    starts, ends = bounds[:-1], bounds[1:]
+    with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+        chunks = executor.map(_parse_file_range, [file_path] * len(starts), starts, ends)
+        # Stitch each field's column back together across the chunks
+        return [list(chain.from_iterable(column)) for column in zip(*chunks)]
+
+@functools.lru_cache(maxsize=1 << 16)
+def _harmony_score(message: str, word_count: int = None) -> float:
+    """Harmony Score for a message text, memoized since chats repeat short messages"""
+    # Factors: length, word count, punctuation, sentiment indicators
+    if word_count is None:
+        word_count = len(message.split())
+        
+    positive_count, negative_count, punctuation_count = harmony_kernel.features(message, _POSITIVE_WORDS, _NEGATIVE_WORDS)
+    return harmony_kernel.score(len(message), word_count, positive_count, negative_count, punctuation_count)
+
 class WhatsAppExtractor:
     def __init__(self):
-        self.messages = []
-        self.harmony_scores = {}
-        self.extracted_at = datetime.utcnow().isoformat()
+        self.extracted_at = _now_iso()
+        self._set_columns([], [], [], [], [])
+        
+    def _set_columns(self, timestamps, contacts, texts, lengths, word_counts):
+        """Store messages as one list per field, dropping any cached analysis"""
+        self.timestamps = timestamps
+        self.contacts = contacts
+        self.texts = texts
+        self.lengths = lengths
+        self.word_counts = word_counts
+        # Harmony Scores in thousandths, index-aligned with the columns
+        # once analyze_messages has run
+        self._harmony = array('H')
+        self._analysis = None
+        
+    def _iter_messages(self):
+        """Yield each message as a dict, built on demand from the columns"""
+        for row in zip(self.timestamps, self.contacts, self.texts, self.lengths, self.word_counts):
+            yield dict(zip(_MESSAGE_FIELDS, row))
+            
+    @property
+    def messages(self) -> List[Dict[str, Any]]:
+        """Extracted messages as dicts (a fresh list built from the columns)"""
+        return list(self._iter_messages())
+        
+    @messages.setter
+    def messages(self, messages: List[Dict[str, Any]]):
+        self._set_columns(*([m[field] for m in messages] for field in _MESSAGE_FIELDS))
+        
+    @property
+    def harmony_scores(self) -> Dict[str, float]:
+        """Harmony Score per message timestamp (a later message wins a shared minute)"""
+        return {timestamp: score / _SCORE_SCALE for timestamp, score in zip(self.timestamps, self._harmony)}
+        
+    def harmony_at(self, index: int) -> float:
+        """Harmony Score of the message at a column index"""
+        return self._harmony[index] / _SCORE_SCALE
+        
+    def _latest_indices(self):
+        """Indices of the last message for each timestamp, in message order
+        
+        Harmony Scores have always been keyed by timestamp, so a later
+        message replaces an earlier one from the same minute. The statistics
+        and the export keep that, using one flag byte per message rather
+        than a timestamp -> float dict.
+        """
+        timestamps = self.timestamps
+        latest = bytearray(len(timestamps))
+        seen = set()
+        for i in range(len(timestamps) - 1, -1, -1):
+            if timestamps[i] not in seen:
+                seen.add(timestamps[i])
+                latest[i] = 1
+        return compress(range(len(latest)), latest)
         
     def extract_from_txt(self, file_path: str) -> List[Dict[str, Any]]:
         """Extract messages from exported WhatsApp txt file"""
-        messages = []
+        columns = ([], [], [], [], [])
         
         if not os.path.exists(file_path):
             return {"status": "error", "message": f"File not found: {file_path}"}
             
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                
-            for line in lines:
-                # WhatsApp format: [HH:MM, DD/MM/YYYY] Contact: Message
-                match = re.match(r'\[(\d{2}:\d{2}),\s*(\d{2}/\d{2}/\d{4})\]\s*([^:]+):\s*(.*)', line)
-                if match:
-                    time_str, date_str, contact, message = match.groups()
-                    messages.append({
-                        "timestamp": f"{date_str} {time_str}",
-                        "contact": contact.strip(),
-                        "message": message.strip(),
-                        "length": len(message),
-                        "word_count": len(message.split())
-                    })
-                    
-            self.messages = messages
-            return {"status": "success", "messages_extracted": len(messages)}
+            with open(file_path, 'rb') as f:
+                info = os.fstat(f.fileno())
+                if not stat.S_ISREG(info.st_mode):
+                    # Pipes, FIFOs and /dev/stdin report no size and cannot be mapped
+                    buf = f.read()
+                    columns = _parse_range(buf, 0, len(buf))
+                elif info.st_size:
+                    # Parse straight out of the page cache instead of reading lines into memory
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        columns = None
+                        if len(mm) >= _PARALLEL_MIN_BYTES and (os.cpu_count() or 1) > 1:
+                            try:
+                                columns = _parse_parallel(file_path, mm)
+                            except (ImportError, NotImplementedError, OSError):
+                                # No working process pool here (e.g. no sem_open on Android)
+                                columns = None
+                        if columns is None:
+                            columns = _parse_range(mm, 0, len(mm))
+                        
+            self._set_columns(*columns)
+            return {"status": "success", "messages_extracted": len(self.texts)}
         except Exception as e:
             return {"status": "error", "message": str(e)}
             
-    def calculate_harmony_score(self, message: str) -> float:
-        """Calculate Harmony Score for a message"""
-        # Factors: length, word count, punctuation, sentiment indicators
-        
-        length_score = min(1.0, len(message) / 200.0)  # Optimal: 200 chars
-        word_count = len(message.split())
-        word_score = min(1.0, word_count / 50.0)  # Optimal: 50 words
-        
-        # Sentiment indicators
-        positive_words = ["good", "great", "love", "happy", "yes", "thanks", "please"]
-        negative_words = ["bad", "hate", "angry", "sad", "no", "never", "sorry"]
-        
-        positive_count = sum(1 for word in positive_words if word in message.lower())
-        negative_count = sum(1 for word in negative_words if word in message.lower())
-        
-        sentiment_score = (positive_count - negative_count) / 10.0
-        sentiment_score = max(0.0, min(1.0, sentiment_score + 0.5))
-        
-        # Punctuation (well-punctuated messages score higher)
-        punctuation_count = sum(1 for c in message if c in ".,!?;:")
-        punctuation_score = min(1.0, punctuation_count / 5.0)
-        
-        # Weighted average
-        harmony = (length_score * 0.25 + word_score * 0.25 + sentiment_score * 0.25 + punctuation_score * 0.25)
-        return round(harmony, 3)
+    def calculate_harmony_score(self, message: str, word_count: int = None) -> float:
+        """Calculate Harmony Score for a message (word_count if already known)"""
+        return _harmony_score(message, word_count)
         
     def analyze_messages(self) -> Dict[str, Any]:
         """Analyze all extracted messages"""
-        if not self.messages:
+        if not self.texts:
             return {"status": "error", "message": "No messages extracted"}
             
+        # Totals come straight off the columns
+        total_chars = sum(self.lengths)
+        
         analysis = {
-            "total_messages": len(self.messages),
-            "total_characters": sum(m["length"] for m in self.messages),
-            "total_words": sum(m["word_count"] for m in self.messages),
-            "average_message_length": sum(m["length"] for m in self.messages) / len(self.messages),
-            "contacts": list(set(m["contact"] for m in self.messages)),
+            "total_messages": len(self.texts),
+            "total_characters": total_chars,
+            "total_words": sum(self.word_counts),
+            "average_message_length": total_chars / len(self.texts),
+            "contacts": list(set(self.contacts)),
             "harmony_scores": {}
         }
         
-        # Calculate harmony for each message
-        for msg in self.messages:
-            harmony = self.calculate_harmony_score(msg["message"])
-            self.harmony_scores[msg["timestamp"]] = harmony
+        # Score every message in one batch, kept as 2-byte thousandths
+        if not self._harmony:
+            scores = map(_harmony_score, self.texts, self.word_counts)
+            self._harmony = array('H', (round(score * _SCORE_SCALE) for score in scores))
             
-        analysis["average_harmony"] = round(sum(self.harmony_scores.values()) / len(self.harmony_scores), 3)
-        analysis["max_harmony"] = round(max(self.harmony_scores.values()), 3)
-        analysis["min_harmony"] = round(min(self.harmony_scores.values()), 3)
+        # Aggregate the thousandths directly; no float per message is built
+        latest = array('H', map(self._harmony.__getitem__, self._latest_indices()))
+        analysis["average_harmony"] = round(sum(latest) / len(latest) / _SCORE_SCALE, 3)
+        analysis["max_harmony"] = max(latest) / _SCORE_SCALE
+        analysis["min_harmony"] = min(latest) / _SCORE_SCALE
         
+        self._analysis = analysis
         return analysis
         
     def export_to_mega(self, output_path: str = None) -> Dict[str, Any]:
@@ -102,17 +241,33 @@ class WhatsAppExtractor:
         if not output_path:
             output_path = f"/home/ubuntu/whatsapp_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             
-        export_data = {
-            "extracted_at": self.extracted_at,
-            "messages": self.messages,
-            "harmony_scores": self.harmony_scores,
-            "analysis": self.analyze_messages()
-        }
+        # Reuse an analysis already run on these messages
+        analysis = self._analysis or self.analyze_messages()
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
-            return {"status": "success", "exported_to": output_path, "size": len(json.dumps(export_data))}
+            # Write the document piece by piece, one message or score per
+            # line, so no second copy of the export is built in memory
+            with open(output_path, 'wb', buffering=1 << 20) as f:
+                f.write(b'{\n  "extracted_at": ')
+                f.write(merkabah_json.encode(self.extracted_at))
+                f.write(b',\n  "messages": [')
+                separator = b'\n    '
+                for message in self._iter_messages():
+                    f.write(separator)
+                    f.write(merkabah_json.encode(message))
+                    separator = b',\n    '
+                f.write(b'\n  ],\n  "harmony_scores": {')
+                separator = b'\n    '
+                for i in self._latest_indices():
+                    f.write(separator)
+                    f.write(merkabah_json.encode(self.timestamps[i]))
+                    f.write(b': ')
+                    f.write(merkabah_json.encode(self._harmony[i] / _SCORE_SCALE))
+                    separator = b',\n    '
+                f.write(b'\n  },\n  "analysis": ')
+                f.write(merkabah_json.encode(analysis))
+                f.write(b'\n}\n')
+            return {"status": "success", "exported_to": output_path, "size": os.path.getsize(output_path)}
         except Exception as e:
             return {"status": "error", "message": str(e)}
             
@@ -121,30 +276,19 @@ class WhatsAppExtractor:
         harmony = self.calculate_harmony_score(message)
         
         # Determine which face should process this
-        if harmony > 0.8:
-            face = "EAGLE"  # High quality - Seer processes
-            action = "ARCHIVE"
-        elif harmony > 0.6:
-            face = "LION"  # Good quality - Judge verifies
-            action = "VERIFY"
-        elif harmony > 0.4:
-            face = "OX"  # Medium quality - Servant processes
-            action = "PROCESS"
-        else:
-            face = "MAN"  # Low quality - Witness checks
-            action = "REVIEW"
+        route = harmony_kernel.face_index(harmony)
+        face = harmony_kernel.FACES[route]
+        action = _FACE_ACTIONS[route]
             
         return {
             "message": message,
             "harmony_score": harmony,
             "assigned_face": face,
             "action": action,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _now_iso()
         }
 
 def main():
-    import sys
-    
     extractor = WhatsAppExtractor()
     
     if len(sys.argv) > 1:
@@ -153,20 +297,20 @@ def main():
         if command == "extract" and len(sys.argv) > 2:
             file_path = sys.argv[2]
             result = extractor.extract_from_txt(file_path)
-            print(json.dumps(result, indent=2))
+            print(merkabah_json.dumps(result))
             
         elif command == "analyze":
             analysis = extractor.analyze_messages()
-            print(json.dumps(analysis, indent=2))
+            print(merkabah_json.dumps(analysis))
             
         elif command == "export":
             export_result = extractor.export_to_mega()
-            print(json.dumps(export_result, indent=2))
+            print(merkabah_json.dumps(export_result))
             
         elif command == "pipe" and len(sys.argv) > 2:
             message = " ".join(sys.argv[2:])
             result = extractor.pipe_through_merkabah(message)
-            print(json.dumps(result, indent=2))
+            print(merkabah_json.dumps(result))
     else:
         print("Usage:")
         print("  merkabah-extract extract <file>  - Extract from WhatsApp txt export")
@@ -4,11 +4,102 @@ UNIFIED PLATFORM EXTRACTOR FRAMEWORK
 Extract data from all social media and messaging platforms
 Route through Merkabah Four-Face system with Harmony Scores
 """
-import json
+import functools
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
 from datetime import datetime
 from abc import ABC, abstractmethod
 
+import harmony_kernel
+import merkabah_json
+
+# Sentiment indicators, matched against the lowercased word tokens
+_POSITIVE_WORDS = frozenset({"good", "great", "love", "happy", "yes", "thanks"})
+_NEGATIVE_WORDS = frozenset({"bad", "hate", "angry", "sad", "no", "never"})
+
+@functools.lru_cache(maxsize=1 << 16)
+def _harmony(message: str) -> float:
+    """Harmony Score for a message text (cached per distinct text)"""
+    positive, negative, punctuation = harmony_kernel.features(message, _POSITIVE_WORDS, _NEGATIVE_WORDS)
+    return harmony_kernel.score(len(message), len(message.split()), positive, negative, punctuation)
+
+# Static capability info returned by each extractor; shared, so treat as read-only
+_PLATFORM_INFO = {
+    "discord": {
+        "platform": "Discord",
+        "status": "ready",
+        "methods": ["json_export", "api_token"],
+        "data_types": ["messages", "reactions", "threads", "voice_logs"]
+    },
+    "telegram": {
+        "platform": "Telegram",
+        "status": "ready",
+        "methods": ["json_export", "api_token", "local_database"],
+        "data_types": ["messages", "media", "stickers", "channels", "groups"]
+    },
+    "x": {
+        "platform": "X",
+        "status": "ready",
+        "methods": ["api_v2", "archive_export", "web_scrape"],
+        "data_types": ["tweets", "replies", "retweets", "likes", "bookmarks", "dms"]
+    },
+    "facebook": {
+        "platform": "Facebook",
+        "status": "ready",
+        "methods": ["data_export", "api_token", "graph_api"],
+        "data_types": ["posts", "comments", "messages", "reactions", "photos"]
+    },
+    "instagram": {
+        "platform": "Instagram",
+        "status": "ready",
+        "methods": ["data_export", "api_token", "graph_api"],
+        "data_types": ["posts", "comments", "dms", "stories", "reels", "likes"]
+    },
+    "reddit": {
+        "platform": "Reddit",
+        "status": "ready",
+        "methods": ["api_token", "pushshift_api", "web_scrape"],
+        "data_types": ["posts", "comments", "awards", "saved", "subscriptions"]
+    },
+    "linkedin": {
+        "platform": "LinkedIn",
+        "status": "ready",
+        "methods": ["data_export", "api_token"],
+        "data_types": ["posts", "comments", "messages", "connections", "endorsements"]
+    },
+    "tiktok": {
+        "platform": "TikTok",
+        "status": "ready",
+        "methods": ["api_token", "data_export", "web_scrape"],
+        "data_types": ["videos", "comments", "likes", "bookmarks", "messages"]
+    },
+    "twitch": {
+        "platform": "Twitch",
+        "status": "ready",
+        "methods": ["api_token", "chat_logs"],
+        "data_types": ["chat_messages", "clips", "vods", "follows", "subscriptions"]
+    },
+    "youtube": {
+        "platform": "YouTube",
+        "status": "ready",
+        "methods": ["api_token", "transcript_api"],
+        "data_types": ["comments", "transcripts", "metadata", "likes", "playlists"]
+    },
+    "mastodon": {
+        "platform": "Mastodon",
+        "status": "ready",
+        "methods": ["api_token", "instance_api"],
+        "data_types": ["toots", "replies", "boosts", "favorites", "dms"]
+    },
+    "bluesky": {
+        "platform": "BlueSky",
+        "status": "ready",
+        "methods": ["api_token", "firehose"],
+        "data_types": ["posts", "replies", "reposts", "likes", "follows"]
+    }
+}
+
 class PlatformExtractor(ABC):
     """Base class for all platform extractors"""
     
@@ -24,31 +115,11 @@ class PlatformExtractor(ABC):
     
     def calculate_harmony(self, message: str) -> float:
         """Calculate Harmony Score for message"""
-        length_score = min(1.0, len(message) / 200.0)
-        word_score = min(1.0, len(message.split()) / 50.0)
-        
-        positive_words = ["good", "great", "love", "happy", "yes", "thanks"]
-        negative_words = ["bad", "hate", "angry", "sad", "no", "never"]
-        
-        positive = sum(1 for w in positive_words if w in message.lower())
-        negative = sum(1 for w in negative_words if w in message.lower())
-        sentiment = max(0.0, min(1.0, (positive - negative) / 10.0 + 0.5))
-        
-        punctuation = sum(1 for c in message if c in ".,!?;:")
-        punctuation_score = min(1.0, punctuation / 5.0)
-        
-        return round((length_score * 0.25 + word_score * 0.25 + sentiment * 0.25 + punctuation_score * 0.25), 3)
+        return _harmony(message)
     
     def assign_face(self, harmony: float) -> str:
         """Assign Merkabah face based on Harmony Score"""
-        if harmony > 0.8:
-            return "EAGLE"  # Archive
-        elif harmony > 0.6:
-            return "LION"   # Verify
-        elif harmony > 0.4:
-            return "OX"     # Process
-        else:
-            return "MAN"    # Review
+        return harmony_kernel.FACES[harmony_kernel.face_index(harmony)]
 
 class DiscordExtractor(PlatformExtractor):
     def __init__(self):
@@ -56,12 +127,7 @@ class DiscordExtractor(PlatformExtractor):
     
     def extract(self, source: str) -> Dict[str, Any]:
         """Extract from Discord JSON export or API"""
-        return {
-            "platform": "Discord",
-            "status": "ready",
-            "methods": ["json_export", "api_token"],
-            "data_types": ["messages", "reactions", "threads", "voice_logs"]
-        }
+        return _PLATFORM_INFO["discord"]
 
 class TelegramExtractor(PlatformExtractor):
     def __init__(self):
@@ -69,12 +135,7 @@ class TelegramExtractor(PlatformExtractor):
     
     def extract(self, source: str) -> Dict[str, Any]:
         """Extract from Telegram JSON export or API"""
-        return {
-            "platform": "Telegram",
-            "status": "ready",
-            "methods": ["json_export", "api_token", "local_database"],
-            "data_types": ["messages", "media", "stickers", "channels", "groups"]
-        }
+        return _PLATFORM_INFO["telegram"]
 
 class XExtractor(PlatformExtractor):
     def __init__(self):
@@ -82,12 +143,7 @@ class XExtractor(PlatformExtractor):
     
     def extract(self, source: str) -> Dict[str, Any]:
         """Extract from X (Twitter) API or archive"""
-        return {
-            "platform": "X",
-            "status": "ready",
-            "methods": ["api_v2", "archive_export", "web_scrape"],
-            "data_types": ["tweets", "replies", "retweets", "likes", "bookmarks", "dms"]
-        }
+        return _PLATFORM_INFO["x"]
 
 class FacebookExtractor(PlatformExtractor):
     def __init__(self):
@@ -95,12 +151,7 @@ class FacebookExtractor(PlatformExtractor):
     
     def extract(self, source: str) -> Dict[str, Any]:
         """Extract from Facebook data export"""
-        return {
-            "platform": "Facebook",
-            "status": "ready",
-            "methods": ["data_export", "api_token", "graph_api"],
-            "data_types": ["posts", "comments", "messages", "reactions", "photos"]
-        }
+        return _PLATFORM_INFO["facebook"]
 
 class InstagramExtractor(PlatformExtractor):
     def __init__(self):
@@ -108,12 +159,7 @@ class InstagramExtractor(PlatformExtractor):
     
     def extract(self, source: str) -> Dict[str, Any]:
         """Extract from Instagram data export"""
-        return {
-            "platform": "Instagram",
-            "status": "ready",
-            "methods": ["data_export", "api_token", "graph_api"],
-            "data_types": ["posts", "comments", "dms", "stories", "reels", "likes"]
-        }
+        return _PLATFORM_INFO["instagram"]
 
 class RedditExtractor(PlatformExtractor):
     def __init__(self):
@@ -121,12 +167,7 @@ class RedditExtractor(PlatformExtractor):
     
     def extract(self, source: str) -> Dict[str, Any]:
         """Extract from Reddit API or archive"""
-        return {
-            "platform": "Reddit",
-            "status": "ready",
-            "methods": ["api_token", "pushshift_api", "web_scrape"],
-            "data_types": ["posts", "comments", "awards", "saved", "subscriptions"]
-        }
+        return _PLATFORM_INFO["reddit"]
 
 class LinkedInExtractor(PlatformExtractor):
     def __init__(self):
@@ -134,12 +175,7 @@ class LinkedInExtractor(PlatformExtractor):
     
     def extract(self, source: str) -> Dict[str, Any]:
         """Extract from LinkedIn data export"""
-        return {
-            "platform": "LinkedIn",
-            "status": "ready",
-            "methods": ["data_export", "api_token"],
-            "data_types": ["posts", "comments", "messages", "connections", "endorsements"]
-        }
+        return _PLATFORM_INFO["linkedin"]
 
 class TikTokExtractor(PlatformExtractor):
     def __init__(self):
@@ -147,12 +183,7 @@ class TikTokExtractor(PlatformExtractor):
     
     def extract(self, source: str) -> Dict[str, Any]:
         """Extract from TikTok API or archive"""
-        return {
-            "platform": "TikTok",
-            "status": "ready",
-            "methods": ["api_token", "data_export", "web_scrape"],
-            "data_types": ["videos", "comments", "likes", "bookmarks", "messages"]
-        }
+        return _PLATFORM_INFO["tiktok"]
 
 class TwitchExtractor(PlatformExtractor):
     def __init__(self):
@@ -160,12 +191,7 @@ class TwitchExtractor(PlatformExtractor):
     
     def extract(self, source: str) -> Dict[str, Any]:
         """Extract from Twitch API"""
-        return {
-            "platform": "Twitch",
-            "status": "ready",
-            "methods": ["api_token", "chat_logs"],
-            "data_types": ["chat_messages", "clips", "vods", "follows", "subscriptions"]
-        }
+        return _PLATFORM_INFO["twitch"]
 
 class YouTubeExtractor(PlatformExtractor):
     def __init__(self):
@@ -173,12 +199,7 @@ class YouTubeExtractor(PlatformExtractor):
     
     def extract(self, source: str) -> Dict[str, Any]:
         """Extract from YouTube API (already integrated)"""
-        return {
-            "platform": "YouTube",
-            "status": "ready",
-            "methods": ["api_token", "transcript_api"],
-            "data_types": ["comments", "transcripts", "metadata", "likes", "playlists"]
-        }
+        return _PLATFORM_INFO["youtube"]
 
 class MastodonExtractor(PlatformExtractor):
     def __init__(self):
@@ -186,12 +207,7 @@ class MastodonExtractor(PlatformExtractor):
     
     def extract(self, source: str) -> Dict[str, Any]:
         """Extract from Mastodon instance API"""
-        return {
-            "platform": "Mastodon",
-            "status": "ready",
-            "methods": ["api_token", "instance_api"],
-            "data_types": ["toots", "replies", "boosts", "favorites", "dms"]
-        }
+        return _PLATFORM_INFO["mastodon"]
 
 class BlueSkyExtractor(PlatformExtractor):
     def __init__(self):
@@ -199,57 +215,70 @@ class BlueSkyExtractor(PlatformExtractor):
     
     def extract(self, source: str) -> Dict[str, Any]:
         """Extract from BlueSky API"""
-        return {
-            "platform": "BlueSky",
-            "status": "ready",
-            "methods": ["api_token", "firehose"],
-            "data_types": ["posts", "replies", "reposts", "likes", "follows"]
-        }
+        return _PLATFORM_INFO["bluesky"]
+
+# Extractor class behind each supported platform key
+_FACTORIES = {
+    "discord": DiscordExtractor,
+    "telegram": TelegramExtractor,
+    "x": XExtractor,
+    "facebook": FacebookExtractor,
+    "instagram": InstagramExtractor,
+    "reddit": RedditExtractor,
+    "linkedin": LinkedInExtractor,
+    "tiktok": TikTokExtractor,
+    "twitch": TwitchExtractor,
+    "youtube": YouTubeExtractor,
+    "mastodon": MastodonExtractor,
+    "bluesky": BlueSkyExtractor
+}
+
+# Extractors are stateless between extract() calls, so every
+# UnifiedExtractor shares one instance per platform, created on first use
+_INSTANCES = {}
 
 class UnifiedExtractor:
     """Master extractor that manages all platforms"""
     
-    def __init__(self):
-        self.extractors = {
-            "discord": DiscordExtractor(),
-            "telegram": TelegramExtractor(),
-            "x": XExtractor(),
-            "facebook": FacebookExtractor(),
-            "instagram": InstagramExtractor(),
-            "reddit": RedditExtractor(),
-            "linkedin": LinkedInExtractor(),
-            "tiktok": TikTokExtractor(),
-            "twitch": TwitchExtractor(),
-            "youtube": YouTubeExtractor(),
-            "mastodon": MastodonExtractor(),
-            "bluesky": BlueSkyExtractor()
-        }
+    def _get(self, platform: str) -> PlatformExtractor:
+        """Get the shared extractor for a platform key, creating it on first use"""
+        extractor = _INSTANCES.get(platform)
+        if extractor is None:
+            # setdefault keeps a single winner if two threads race here
+            extractor = _INSTANCES.setdefault(platform, _FACTORIES[platform]())
+        return extractor
+    
+    @property
+    def extractors(self) -> Dict[str, PlatformExtractor]:
+        """All platform extractors, keyed by platform"""
+        return {platform: self._get(platform) for platform in _FACTORIES}
     
     def get_all_platforms(self) -> Dict[str, Any]:
         """Get all supported platforms"""
-        return {
-            platform: extractor.extract("")
-            for platform, extractor in self.extractors.items()
-        }
+        return dict(_PLATFORM_INFO)
     
     def extract_from_platform(self, platform: str, source: str) -> Dict[str, Any]:
         """Extract from specific platform"""
-        if platform.lower() not in self.extractors:
+        if platform.lower() not in _FACTORIES:
             return {"status": "error", "message": f"Platform {platform} not supported"}
         
-        extractor = self.extractors[platform.lower()]
+        extractor = self._get(platform.lower())
         return extractor.extract(source)
     
     def extract_all(self, sources: Dict[str, str]) -> Dict[str, Any]:
         """Extract from multiple platforms simultaneously"""
-        results = {}
-        for platform, source in sources.items():
-            results[platform] = self.extract_from_platform(platform, source)
-        return results
+        if not sources:
+            return {}
+        
+        # Platform extraction is network-bound, so run the platforms side by side
+        with ThreadPoolExecutor(max_workers=min(32, len(sources))) as executor:
+            futures = {
+                platform: executor.submit(self.extract_from_platform, platform, source)
+                for platform, source in sources.items()
+            }
+            return {platform: future.result() for platform, future in futures.items()}
 
 def main():
-    import sys
-    
     unified = UnifiedExtractor()
     
     if len(sys.argv) > 1:
@@ -257,13 +286,13 @@ def main():
         
         if command == "list":
             platforms = unified.get_all_platforms()
-            print(json.dumps(platforms, indent=2))
+            print(merkabah_json.dumps(platforms, ascii_only=True))
         
         elif command == "extract" and len(sys.argv) > 2:
             platform = sys.argv[2]
             source = sys.argv[3] if len(sys.argv) > 3 else ""
             result = unified.extract_from_platform(platform, source)
-            print(json.dumps(result, indent=2))
+            print(merkabah_json.dumps(result, ascii_only=True))
     else:
         print("Unified Platform Extractor Framework")
         print("Usage:")